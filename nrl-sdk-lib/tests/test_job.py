@@ -3,8 +3,6 @@
 from datetime import UTC, datetime
 from uuid import UUID
 
-import pytest
-
 from nrl_sdk_lib.models import (
     BatchDataFull,
     BatchDataLite,
@@ -14,18 +12,13 @@ from nrl_sdk_lib.models import (
     JobOperation,
 )
 
-
-@pytest.fixture
-def anyio_backend() -> str:
-    """Use the asyncio backend for the anyio fixture."""
-    return "asyncio"
+JOB_ID = UUID("1cda28c1-f84c-430f-b2ce-a2297a4262b8")
 
 
-@pytest.mark.anyio
-async def test_job_model_with_id() -> None:
+def test_job_model_with_id() -> None:
     """Should create a valid job object."""
     job_dict = {
-        "id": "1cda28c1-f84c-430f-b2ce-a2297a4262b8",
+        "id": str(JOB_ID),
         "status": "pending",
         "content_type": "application/json",
         "operation": JobOperation.VALIDATE,
@@ -34,7 +27,7 @@ async def test_job_model_with_id() -> None:
                 "id": "7c93f77d-af17-4145-86c8-e3d17a3f1541",
                 "type": "geojson",
                 "content_type": "application/json",
-                "job_id": "1cda28c1-f84c-430f-b2ce-a2297a4262b8",
+                "job_id": str(JOB_ID),
             }
         ],
         "created_at": datetime(2023, 10, 1, 12, 0, 0, tzinfo=UTC),
@@ -43,7 +36,7 @@ async def test_job_model_with_id() -> None:
     }
 
     job = Job.model_validate(job_dict)
-    assert job.id == UUID("1cda28c1-f84c-430f-b2ce-a2297a4262b8")
+    assert job.id == JOB_ID
     assert job.status == "pending"
     assert job.content_type == "application/json"
     assert job.operation == JobOperation.VALIDATE
@@ -62,8 +55,7 @@ async def test_job_model_with_id() -> None:
         assert job_data.job_id == job.id
 
 
-@pytest.mark.anyio
-async def test_job_model_without_id() -> None:
+def test_job_model_without_id() -> None:
     """Should create a valid job object with id."""
     job_dict = {
         "status": "pending",
@@ -87,11 +79,10 @@ async def test_job_model_without_id() -> None:
     assert job.job_data is None
 
 
-@pytest.mark.anyio
-async def test_job_model_with_cim() -> None:
+def test_job_model_with_cim() -> None:
     """Should create a valid job object with id."""
     job_dict = {
-        "id": "1cda28c1-f84c-430f-b2ce-a2297a4262b8",
+        "id": str(JOB_ID),
         "status": "pending",
         "content_type": "application/json",
         "operation": JobOperation.VALIDATE,
@@ -100,7 +91,7 @@ async def test_job_model_with_cim() -> None:
                 "id": "292fdfae-9e3a-4389-b6a8-0bfbd662fff9",
                 "type": "cim",
                 "content_type": "application/json",
-                "job_id": "1cda28c1-f84c-430f-b2ce-a2297a4262b8",
+                "job_id": str(JOB_ID),
             }
         ],
         "created_at": datetime(2023, 10, 1, 12, 0, 0, tzinfo=UTC),
@@ -129,11 +120,10 @@ async def test_job_model_with_cim() -> None:
         assert job_data.job_id == job.id
 
 
-@pytest.mark.anyio
-async def test_job_model_with_cim_and_geojson() -> None:
+def test_job_model_with_cim_and_geojson() -> None:
     """Should create a valid job object with id."""
     job_dict = {
-        "id": "1cda28c1-f84c-430f-b2ce-a2297a4262b8",
+        "id": str(JOB_ID),
         "status": "pending",
         "content_type": "application/json",
         "operation": JobOperation.VALIDATE,
@@ -142,19 +132,19 @@ async def test_job_model_with_cim_and_geojson() -> None:
                 "id": "7c93f77d-af17-4145-86c8-e3d17a3f1541",
                 "type": "geojson",
                 "content_type": "application/json",
-                "job_id": "1cda28c1-f84c-430f-b2ce-a2297a4262b8",
+                "job_id": str(JOB_ID),
             },
             {
                 "id": "64f5c666-e180-4aaa-b3d6-b98921b95bbc",
                 "type": "geojson",
                 "content_type": "application/json",
-                "job_id": "1cda28c1-f84c-430f-b2ce-a2297a4262b8",
+                "job_id": str(JOB_ID),
             },
             {
                 "id": "292fdfae-9e3a-4389-b6a8-0bfbd662fff9",
                 "type": "cim",
                 "content_type": "application/json",
-                "job_id": "1cda28c1-f84c-430f-b2ce-a2297a4262b8",
+                "job_id": str(JOB_ID),
             },
         ],
         "created_at": datetime(2023, 10, 1, 12, 0, 0, tzinfo=UTC),
@@ -197,8 +187,7 @@ async def test_job_model_with_cim_and_geojson() -> None:
         assert cim.job_id == job.id
 
 
-@pytest.mark.anyio
-async def test_batch_data_model_with_only_mandatory_properties() -> None:
+def test_batch_data_model_with_only_mandatory_properties() -> None:
     """Should create a valid batch data object."""
     batch_data_dict = {
         "batch_number": 1,
@@ -206,7 +195,7 @@ async def test_batch_data_model_with_only_mandatory_properties() -> None:
         "status": "pending",
         "content_type": "application/json",
         "content": {"key": "value"},
-        "job_id": "1cda28c1-f84c-430f-b2ce-a2297a4262b8",
+        "job_id": str(JOB_ID),
         "created_at": datetime(2023, 10, 1, 12, 0, 0, tzinfo=UTC),
     }
 
@@ -216,7 +205,7 @@ async def test_batch_data_model_with_only_mandatory_properties() -> None:
     assert batch_data.batch_number == 1
     assert batch_data.status == "pending"
     assert batch_data.content_type == "application/json"
-    assert batch_data.job_id == UUID("1cda28c1-f84c-430f-b2ce-a2297a4262b8")
+    assert batch_data.job_id == JOB_ID
     assert batch_data.created_at == datetime(2023, 10, 1, 12, 0, 0, tzinfo=UTC)
     assert batch_data.number_of_features == 1
     assert batch_data.started_at is None
@@ -224,15 +213,14 @@ async def test_batch_data_model_with_only_mandatory_properties() -> None:
     assert hasattr(batch_data, "content") is False
 
 
-@pytest.mark.anyio
-async def test_batch_data_model_with_all_properties() -> None:
+def test_batch_data_model_with_all_properties() -> None:
     """Should create a valid batch data object."""
     batch_data_dict = {
         "id": "7c93f77d-af17-4145-86c8-e3d17a3f1541",
         "batch_number": 1,
         "status": "pending",
         "content_type": "application/json",
-        "job_id": "1cda28c1-f84c-430f-b2ce-a2297a4262b8",
+        "job_id": str(JOB_ID),
         "created_at": datetime(2023, 10, 1, 12, 0, 0, tzinfo=UTC),
         "started_at": datetime(2023, 10, 1, 12, 5, 0, tzinfo=UTC),
         "finished_at": datetime(2023, 10, 1, 12, 10, 0, tzinfo=UTC),
@@ -246,7 +234,7 @@ async def test_batch_data_model_with_all_properties() -> None:
     assert batch_data.batch_number == 1
     assert batch_data.status == "pending"
     assert batch_data.content_type == "application/json"
-    assert batch_data.job_id == UUID("1cda28c1-f84c-430f-b2ce-a2297a4262b8")
+    assert batch_data.job_id == JOB_ID
     assert batch_data.created_at == datetime(2023, 10, 1, 12, 0, 0, tzinfo=UTC)
     assert batch_data.started_at == datetime(2023, 10, 1, 12, 5, 0, tzinfo=UTC)
     assert batch_data.finished_at == datetime(2023, 10, 1, 12, 10, 0, tzinfo=UTC)
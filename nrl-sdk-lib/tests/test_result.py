@@ -2,8 +2,6 @@
 
 from uuid import UUID
 
-import pytest
-
 from nrl_sdk_lib.models import (
     Result,
     ResultStage,
@@ -11,46 +9,44 @@ from nrl_sdk_lib.models import (
     ResultType,
 )
 
-
-@pytest.fixture
-def anyio_backend() -> str:
-    """Use the asyncio backend for the anyio fixture."""
-    return "asyncio"
+JOB_ID = UUID("cd0d49f7-c19d-432c-bc8d-bb9c2bd0f325")
+RESULT_ID = UUID("764eff66-2b4b-4283-819f-c7f7cd245a13")
+FAILED_JOB_ID = UUID("e4000512-fa93-4a35-882b-c665a8150a1d")
+FAILED_RESULT_ID = UUID("1479de31-ed05-4461-8333-becd76a2254a")
+KOMPONENT_ID = UUID("4e2baa5f-80ea-4376-acbd-095054825d11")
 
 
-@pytest.mark.anyio
-async def test_result_model_without_errors() -> None:
+def test_result_model_without_errors() -> None:
     """Should create a valid result object."""
     result_data = {
         "status": "success",
-        "job_id": "cd0d49f7-c19d-432c-bc8d-bb9c2bd0f325",
+        "job_id": str(JOB_ID),
         "batch_number": 1,
-        "id": "764eff66-2b4b-4283-819f-c7f7cd245a13",
+        "id": str(RESULT_ID),
     }
 
     result = Result.model_validate(result_data)
     assert result.status == ResultStatus.SUCCESS
     assert result.stage is None
-    assert result.job_id == UUID("cd0d49f7-c19d-432c-bc8d-bb9c2bd0f325")
+    assert result.job_id == JOB_ID
     assert result.batch_number == 1
     assert result.type is None
     assert result.errors == []
-    assert result.id == UUID("764eff66-2b4b-4283-819f-c7f7cd245a13")
+    assert result.id == RESULT_ID
 
 
-@pytest.mark.anyio
-async def test_result_model_with_errors() -> None:
+def test_result_model_with_errors() -> None:
     """Should create a valid result object with errors."""
     result_data = {
         "status": "failure",
         "stage": 2,
-        "job_id": "e4000512-fa93-4a35-882b-c665a8150a1d",
+        "job_id": str(FAILED_JOB_ID),
         "batch_number": 1,
         "type": "ValidationException",
         "errors": [
             {
                 "reason": "Invalid data format",
-                "komponent_id": "4e2baa5f-80ea-4376-acbd-095054825d11",
+                "komponent_id": str(KOMPONENT_ID),
                 "referanse": {
                     "kodesystemversjon": "1",
                     "komponentkodesystem": "trimble",
@@ -59,66 +55,65 @@ async def test_result_model_with_errors() -> None:
             },
             {
                 "reason": "Missing required field",
-                "komponent_id": "4e2baa5f-80ea-4376-acbd-095054825d11",
+                "komponent_id": str(KOMPONENT_ID),
             },
         ],
-        "id": "1479de31-ed05-4461-8333-becd76a2254a",
+        "id": str(FAILED_RESULT_ID),
     }
 
     result = Result.model_validate(result_data)
     assert result.status == ResultStatus.FAILURE
     assert result.type == ResultType.VALIDATION_EXCEPTION
     assert result.stage == ResultStage.OWNERSHIP
-    assert result.job_id == UUID("e4000512-fa93-4a35-882b-c665a8150a1d")
+    assert result.job_id == FAILED_JOB_ID
     assert result.batch_number == 1
     assert result.errors is not None
     assert len(result.errors) == 2
     assert result.errors[0].reason == "Invalid data format"
-    assert result.errors[0].komponent_id == UUID("4e2baa5f-80ea-4376-acbd-095054825d11")
+    assert result.errors[0].komponent_id == KOMPONENT_ID
     assert result.errors[1].reason == "Missing required field"
-    assert result.errors[1].komponent_id == UUID("4e2baa5f-80ea-4376-acbd-095054825d11")
+    assert result.errors[1].komponent_id == KOMPONENT_ID
     assert result.errors[0].referanse is not None
     assert result.errors[0].referanse.kodesystemversjon == "1"
     assert result.errors[0].referanse.komponentkodesystem == "trimble"
     assert result.errors[0].referanse.komponentkodeverdi == "asdf"
     assert result.errors[1].referanse is None
     # Check the ID
-    assert result.id == UUID("1479de31-ed05-4461-8333-becd76a2254a")
+    assert result.id == FAILED_RESULT_ID
 
 
-@pytest.mark.anyio
-async def test_result_model_with_errors_unknown_type() -> None:
+def test_result_model_with_errors_unknown_type() -> None:
     """Should create a valid result object with errors."""
     result_data = {
         "status": "failure",
         "stage": 2,
-        "job_id": "e4000512-fa93-4a35-882b-c665a8150a1d",
+        "job_id": str(FAILED_JOB_ID),
         "batch_number": 1,
         "type": "UnknownType",
         "errors": [
             {
                 "reason": "Invalid data format",
-                "komponent_id": "4e2baa5f-80ea-4376-acbd-095054825d11",
+                "komponent_id": str(KOMPONENT_ID),
             },
             {
                 "reason": "Missing required field",
-                "komponent_id": "4e2baa5f-80ea-4376-acbd-095054825d11",
+                "komponent_id": str(KOMPONENT_ID),
             },
         ],
-        "id": "1479de31-ed05-4461-8333-becd76a2254a",
+        "id": str(FAILED_RESULT_ID),
     }
 
     result = Result.model_validate(result_data)
     assert result.status == ResultStatus.FAILURE
     assert result.type == "UnknownType"
     assert result.stage == ResultStage.OWNERSHIP
-    assert result.job_id == UUID("e4000512-fa93-4a35-882b-c665a8150a1d")
+    assert result.job_id == FAILED_JOB_ID
     assert result.batch_number == 1
     assert result.errors is not None
     assert len(result.errors) == 2
     assert result.errors[0].reason == "Invalid data format"
-    assert result.errors[0].komponent_id == UUID("4e2baa5f-80ea-4376-acbd-095054825d11")
+    assert result.errors[0].komponent_id == KOMPONENT_ID
     assert result.errors[1].reason == "Missing required field"
-    assert result.errors[1].komponent_id == UUID("4e2baa5f-80ea-4376-acbd-095054825d11")
+    assert result.errors[1].komponent_id == KOMPONENT_ID
     # Check the ID
-    assert result.id == UUID("1479de31-ed05-4461-8333-becd76a2254a")
+    assert result.id == FAILED_RESULT_ID
@@ -20,6 +20,18 @@ def coro(f):  # noqa: ANN001, ANN201
     return wrapper
 
 
+def _parse_error_positions(error_pos: str) -> frozenset[int]:
+    """Parse a comma-separated list of 1-based error positions.
+
+    Duplicate positions collapse into one.
+
+    Raises:
+        ValueError: If a position is empty or not an integer.
+
+    """
+    return frozenset(int(x.strip()) for x in error_pos.split(","))
+
+
 @click.command()
 @coro
 @click.version_option(message=("nrl-test-data-generator, %(version)s"))
@@ -141,7 +153,7 @@ async def cli(  # noqa: PLR0913
     error_positions = None
     if error_pos:
         try:
-            error_positions = [int(x.strip()) for x in error_pos.split(",")]
+            error_positions = _parse_error_positions(error_pos)
         except ValueError:
             msg = (
                 "Error: Invalid error positions format. "
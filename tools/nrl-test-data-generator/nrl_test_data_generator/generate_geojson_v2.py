@@ -15,6 +15,9 @@ from nrl_sdk_lib.models import (
     Point,
 )
 
+# EPSG codes (ETRS89 / UTM) for the UTM zones regions are generated in
+EPSG_CODE_BY_UTM_ZONE: dict[int, str] = {32: "EPSG:25832", 33: "EPSG:25833"}
+
 
 async def generate_geojson_v2(data: dict, filename: str) -> None:
     """Generate GeoJSON file with test data.
@@ -24,14 +27,8 @@ async def generate_geojson_v2(data: dict, filename: str) -> None:
         filename (str): Output GeoJSON filename
 
     """
-    # Determine CRS based on the region zone used
-    utm_zone = data.get("utm_zone", 32)  # Default to zone 32
-    if utm_zone == 32:
-        epsg_code = "EPSG:25832"
-    elif utm_zone == 33:
-        epsg_code = "EPSG:25833"
-    else:
-        epsg_code = "EPSG:25832"  # Default to zone 32
+    # Determine CRS based on the region zone used, defaulting to zone 32
+    epsg_code = EPSG_CODE_BY_UTM_ZONE.get(data.get("utm_zone", 32), "EPSG:25832")
 
     # Create GeoJSON structure
     crs: Crs = Crs(type="name", properties=CrsProperties(name=epsg_code))
@@ -43,8 +40,8 @@ async def generate_geojson_v2(data: dict, filename: str) -> None:
 
     # Add line features (Trase Elements)
     for line in data["trase_lines"]:
-        # Make sure coordinates are 2D only (no height)
-        coordinates = [line["coordinates"][0], line["coordinates"][1]]
+        # Trase lines always hold exactly two 2D points (no height)
+        coordinates = line["coordinates"]
 
         line_string: LineString = LineString(type="LineString", coordinates=coordinates)
 
@@ -5,13 +5,23 @@ import math
 import random
 import re
 import uuid
+from collections.abc import Collection
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 
 import anyio
 import xlsxwriter
 
-from .generate_geojson_v2 import generate_geojson_v2
+from .generate_geojson_v2 import EPSG_CODE_BY_UTM_ZONE, generate_geojson_v2
+
+# Patterns mapping NRL luftspenn/mast type strings to integer codes,
+# checked in order. Compiled once instead of on every lookup.
+_NRL_TYPE_CODES: tuple[tuple[re.Pattern[str], int], ...] = (
+    (re.compile(r"regional", re.IGNORECASE), 8),
+    (re.compile(r"h[oø]gspent|h[oø]yspent", re.IGNORECASE), 4),
+    (re.compile(r"lavspent", re.IGNORECASE), 6),
+)
 
 
 async def generate_files(  # noqa: PLR0913
@@ -19,7 +29,7 @@ async def generate_files(  # noqa: PLR0913
     output_prefix: str = "testdata",
     status: str = "planlagtOppført",
     region: str | None = None,
-    error_positions: list[int] | None = None,
+    error_positions: Collection[int] | None = None,
     error_freq: float | None = None,
     *,
     include_errors: bool = False,
@@ -33,7 +43,7 @@ async def generate_files(  # noqa: PLR0913
         status (str): Status value for the elements
         region (str): Region to generate data in (None for random)
         include_errors (bool): Include error regions in random selection
-        error_positions (list): List of positions (1-based) where
+        error_positions (Collection): Positions (1-based) where
             errors should be injected
         error_freq (float): Frequency of error injection (0.0-1.0)
         v2 (bool): Generate GeoJSON in NRL v2 format if True, else v1
@@ -111,7 +121,7 @@ def generate_random_data(  # noqa: C901, PLR0912, PLR0913, PLR0915
     num_elements: int,
     status: str = "planlagtOppført",
     region: str | None = None,
-    error_positions: list[int] | None = None,
+    error_positions: Collection[int] | None = None,
     error_freq: float | None = None,
     *,
     include_errors: bool = False,
@@ -124,7 +134,7 @@ def generate_random_data(  # noqa: C901, PLR0912, PLR0913, PLR0915
         status (str): Status value for the elements
         region (str): Region to generate data in (None for random)
         include_errors (bool): Include error regions in random selection
-        error_positions (list): List of positions (1-based) where errors
+        error_positions (Collection): Positions (1-based) where errors
             should be injected
         error_freq (float): Frequency of error injection (0.0-1.0)
         v2 (bool): Generate data in NRL v2 format if True, else v1
@@ -267,28 +277,28 @@ def generate_random_data(  # noqa: C901, PLR0912, PLR0913, PLR0915
     hjorring_region = error_regions["Hjorring_Denmark"]
 
     for i in range(num_elements):
-        # Determine if this position should be an error
-        is_error_position = False
-
         # Check if this position should have an error based on error_positions
-        if (error_positions and (i + 1) in error_positions) or (
+        is_error_position = bool(error_positions and (i + 1) in error_positions) or (
             error_freq is not None and random.random() < error_freq
-        ):
-            is_error_position = True
+        )
 
         if is_error_position:
-            # Generate error coordinates around Hjørring with
-            # tighter radius for inland points
-            angle = random.uniform(0, 2 * math.pi)
-            # Use smaller radius (5km) to ensure points are inland
-            distance = random.uniform(0, 1) ** 0.5 * 5000
+            # Generate error coordinates around Hjørring with a smaller
+            # radius (5km) to ensure points are inland
+            center, radius = hjorring_region["center"], 5000
+        else:
+            # Generate normal coordinates within the selected region
+            center, radius = region_data["center"], region_data["radius"]
 
-            x_offset = distance * math.cos(angle)
-            y_offset = distance * math.sin(angle)
+        angle = random.uniform(0, 2 * math.pi)
+        # Use square root to get more uniform distribution across the circle area
+        distance = random.uniform(0, 1) ** 0.5 * radius
 
-            x = hjorring_region["center"][0] + x_offset
-            y = hjorring_region["center"][1] + y_offset
+        # Offset from the center to get the final coordinates
+        x = center[0] + distance * math.cos(angle)
+        y = center[1] + distance * math.sin(angle)
 
+        if is_error_position:
             # Track this error for logging (position is 1-based)
             error_info = {
                 "position": i + 1,
@@ -298,25 +308,18 @@ def generate_random_data(  # noqa: C901, PLR0912, PLR0913, PLR0915
                 "zone": hjorring_region["zone"],
             }
             error_log.append(error_info)
-        else:
-            # Generate normal coordinates within the selected region
-            angle = random.uniform(0, 2 * math.pi)
-            # Use square root to get more uniform distribution across the circle area
-            distance = random.uniform(0, 1) ** 0.5 * region_data["radius"]
-
-            # Calculate the offset from the center
-            x_offset = distance * math.cos(angle)
-            y_offset = distance * math.sin(angle)
-
-            # Get the final coordinates
-            x = region_data["center"][0] + x_offset
-            y = region_data["center"][1] + y_offset
 
         coordinates.append([x, y])
 
+    # Mast and luftspenn type values are spelled differently in NRL v1 and v2
+    mast_type = "lavspentmast" if v2 else "Mast, lavspent"
+    luftspenn_type = "lavspent" if v2 else "Ledning, lavspent"
+
     # Create mast points from our coordinates
     mast_points = []
     error_positions_set = set()  # Track which positions are errors
+    # Index the error log by position so each mast finds its entry directly
+    error_log_by_position = {entry["position"]: entry for entry in error_log}
 
     for i in range(num_elements):
         point_id = str(uuid.uuid4())
@@ -326,16 +329,15 @@ def generate_random_data(  # noqa: C901, PLR0912, PLR0913, PLR0915
             "coordinates": coordinates[i],  # Using only [easting, northing]
             "status": status,
             "komponentident": f"LM{80000 + random.randint(1000, 9999)}",
-            "mastType": "Mast, lavspent" if not v2 else "lavspentmast",
+            "mastType": mast_type,
         }
         mast_points.append(mast_point)
 
         # Update error log with actual ID if this was an error position
-        for error_entry in error_log:
-            if error_entry["position"] == i + 1 and "id" not in error_entry:
-                error_entry["id"] = point_id
-                error_positions_set.add(i)  # Track this position as an error
-                break
+        error_entry = error_log_by_position.get(i + 1)
+        if error_entry is not None:
+            error_entry["id"] = point_id
+            error_positions_set.add(i)  # Track this position as an error
 
     # Create random trase lines connecting mast points
     trase_lines = []
@@ -351,78 +353,44 @@ def generate_random_data(  # noqa: C901, PLR0912, PLR0913, PLR0915
             valid_masts.append(mast)
 
     # Sort both groups to make connections more logical
-    valid_masts_sorted = (
-        sorted(valid_masts, key=lambda x: (x["coordinates"][1], x["coordinates"][0]))
-        if valid_masts
-        else []
+    valid_masts_sorted = sorted(
+        valid_masts, key=lambda x: (x["coordinates"][1], x["coordinates"][0])
     )
-
-    error_masts_sorted = (
-        sorted(error_masts, key=lambda x: (x["coordinates"][1], x["coordinates"][0]))
-        if error_masts
-        else []
+    error_masts_sorted = sorted(
+        error_masts, key=lambda x: (x["coordinates"][1], x["coordinates"][0])
     )
 
-    # Create trase lines for valid masts
-    for i in range(len(valid_masts_sorted)):
-        if len(valid_masts_sorted) > 1:
-            if i < len(valid_masts_sorted) - 1:
-                start_point = valid_masts_sorted[i]
-                end_point = valid_masts_sorted[i + 1]
-            else:
-                # Last point connects to first point
-                start_point = valid_masts_sorted[i]
-                end_point = valid_masts_sorted[0]
-
-            line_id = str(uuid.uuid4())
-            trase_line = {
-                "id": line_id,
-                "coordinates": [start_point["coordinates"], end_point["coordinates"]],
-                "status": status,
-                "komponentident": f"LL{70000 + random.randint(1000, 9999)}",
-                "luftspennType": "Ledning, lavspent" if not v2 else "lavspent",
-            }
-            trase_lines.append(trase_line)
-
-    # Create trase lines for error masts (separate network)
-    for i in range(len(error_masts_sorted)):
-        if len(error_masts_sorted) > 1:
-            if i < len(error_masts_sorted) - 1:
-                start_point = error_masts_sorted[i]
-                end_point = error_masts_sorted[i + 1]
-            else:
-                # Last point connects to first point
-                start_point = error_masts_sorted[i]
-                end_point = error_masts_sorted[0]
-
-            line_id = str(uuid.uuid4())
-            trase_line = {
-                "id": line_id,
-                "coordinates": [start_point["coordinates"], end_point["coordinates"]],
-                "status": status,
-                "komponentident": f"LL{70000 + random.randint(1000, 9999)}",
-                "luftspennType": "Ledning, lavspent" if not v2 else "lavspent",
-            }
-            trase_lines.append(trase_line)
+    # Create trase lines for valid masts, and for error masts as a
+    # separate network
+    for masts_sorted in (valid_masts_sorted, error_masts_sorted):
+        # A ring needs at least two masts
+        if len(masts_sorted) < 2:
+            continue
+
+        # Connect each point to the next, and the last point to the first
+        for start_point, end_point in zip(
+            masts_sorted, masts_sorted[1:] + masts_sorted[:1], strict=True
+        ):
+            trase_lines.append(
+                _create_trase_line(
+                    start_point["coordinates"],
+                    end_point["coordinates"],
+                    status,
+                    luftspenn_type,
+                )
+            )
 
     # If we need more trase lines to match num_elements,
-    # create self-loops or short segments
+    # create self-loops or short segments. There is one mast point per
+    # element, so mast_points is never empty here.
     while len(trase_lines) < num_elements:
-        # Use any available mast point to create a short segment
-        if mast_points:
-            mast = mast_points[len(trase_lines) % len(mast_points)]
-            start_coords = mast["coordinates"]
-            end_coords = [start_coords[0] + 10, start_coords[1] + 10]  # 10m offset
-
-            line_id = str(uuid.uuid4())
-            trase_line = {
-                "id": line_id,
-                "coordinates": [start_coords, end_coords],
-                "status": status,
-                "komponentident": f"LL{70000 + random.randint(1000, 9999)}",
-                "luftspennType": "Ledning, lavspent" if not v2 else "lavspent",
-            }
-            trase_lines.append(trase_line)
+        mast = mast_points[len(trase_lines) % len(mast_points)]
+        start_coords = mast["coordinates"]
+        end_coords = [start_coords[0] + 10, start_coords[1] + 10]  # 10m offset
+
+        trase_lines.append(
+            _create_trase_line(start_coords, end_coords, status, luftspenn_type)
+        )
 
     # Common data structure with Norwegian elements
     common_data = {
@@ -443,7 +411,34 @@ def generate_random_data(  # noqa: C901, PLR0912, PLR0913, PLR0915
     return common_data
 
 
-def generate_excel(data: dict, filename: str) -> None:  # noqa: C901
+def _create_trase_line(
+    start_coords: list[float],
+    end_coords: list[float],
+    status: str,
+    luftspenn_type: str,
+) -> dict:
+    """Create a trase line between two mast coordinates.
+
+    Args:
+        start_coords (list): Start coordinates [easting, northing]
+        end_coords (list): End coordinates [easting, northing]
+        status (str): Status value for the line
+        luftspenn_type (str): luftspennType value for the line
+
+    Returns:
+        dict: The trase line
+
+    """
+    return {
+        "id": str(uuid.uuid4()),
+        "coordinates": [start_coords, end_coords],
+        "status": status,
+        "komponentident": f"LL{70000 + random.randint(1000, 9999)}",
+        "luftspennType": luftspenn_type,
+    }
+
+
+def generate_excel(data: dict, filename: str) -> None:
     """Generate Excel file with test data.
 
     Args:
@@ -669,11 +664,8 @@ def generate_excel(data: dict, filename: str) -> None:  # noqa: C901
     ]
 
     # Write headers to both sheets
-    for col_idx, header in enumerate(mast_headers):
-        mast_sheet.write(0, col_idx, header)
-
-    for col_idx, header in enumerate(trase_headers):
-        trase_sheet.write(0, col_idx, header)
+    mast_sheet.write_row(0, 0, mast_headers)
+    trase_sheet.write_row(0, 0, trase_headers)
 
     # If Norwegian data is provided in common_data, use it
     norwegian_areas = data.get("norwegian_areas", ["Larvik"])
@@ -681,9 +673,13 @@ def generate_excel(data: dict, filename: str) -> None:  # noqa: C901
     impregnering_types = data.get("impregnering_types", ["Kreosot", "Salt"])
     fundament_types = data.get("fundament_types", ["Stolpe på fjell", "Stolpe i jord"])
 
-    # Generate data for mast rows
-    mast_rows = []
-    for _idx, mast in enumerate(data["mast_points"]):
+    # Resolve which row key holds the value for each column
+    mast_keys = _row_keys(mast_headers)
+    trase_keys = _row_keys(trase_headers)
+
+    # Generate data for mast rows, writing each row to the sheet as it is
+    # built so rows are not kept around for the whole workbook
+    for row_idx, mast in enumerate(data["mast_points"]):
         # Derive random but realistic values for the mast
         betegnelse = f"LM{80000 + random.randint(1000, 9999)}"
         area = random.choice(norwegian_areas)
@@ -819,16 +815,14 @@ def generate_excel(data: dict, filename: str) -> None:  # noqa: C901
             "Id på gml. erstattet komponent": None,
             "Risikoindeks": None,
         }
-        mast_rows.append(mast_row)
+        mast_sheet.write_row(row_idx + 1, 0, [mast_row.get(key) for key in mast_keys])
 
-    # Generate random rows for trase lines
-    trase_rows = []
-    for _idx, trase in enumerate(data["trase_lines"]):
+    # Generate random rows for trase lines, written the same way
+    for row_idx, trase in enumerate(data["trase_lines"]):
         # Calculate Euclidean distance for length
-        start = trase["coordinates"][0]
-        end = trase["coordinates"][1]
-        # Simple distance calculation (not accurate for geographic coordinates
-        #  but reasonable for test data)
+        start, end = trase["coordinates"]
+        # Simple distance calculation without z component (not accurate for
+        #  geographic coordinates but reasonable for test data)
         length = (
             (end[0] - start[0]) ** 2 + (end[1] - start[1]) ** 2
         ) ** 0.5 * 100  # No z component for distance calculation
@@ -925,25 +919,9 @@ def generate_excel(data: dict, filename: str) -> None:  # noqa: C901
             "Noyaktighet": None,
             "Id på gml. erstattet komponent": None,
         }
-        trase_rows.append(trase_row)
-
-    # Write Mast data to the sheet
-    for row_idx, row_data in enumerate(mast_rows):
-        for col_idx, header in enumerate(mast_headers):
-            # Handle special case for "Klasse" which appears twice
-            if header == "Klasse" and col_idx == 3:
-                mast_sheet.write(row_idx + 1, col_idx, row_data.get("Klasse_text"))
-            else:
-                mast_sheet.write(row_idx + 1, col_idx, row_data.get(header))
-
-    # Write Trase Element data to the sheet
-    for row_idx, row_data in enumerate(trase_rows):
-        for col_idx, header in enumerate(trase_headers):
-            # Handle special case for "Klasse" which appears twice
-            if header == "Klasse" and col_idx == 3:
-                trase_sheet.write(row_idx + 1, col_idx, row_data.get("Klasse_text"))
-            else:
-                trase_sheet.write(row_idx + 1, col_idx, row_data.get(header))
+        trase_sheet.write_row(
+            row_idx + 1, 0, [trase_row.get(key) for key in trase_keys]
+        )
 
     # Set column widths for better appearance
     mast_sheet.set_column(16, 16, 15.125)  # Column Q
@@ -953,6 +931,25 @@ def generate_excel(data: dict, filename: str) -> None:  # noqa: C901
     workbook.close()
 
 
+def _row_keys(headers: list[str]) -> list[str]:
+    """Resolve the row dict key holding the value for each column.
+
+    "Klasse" appears twice in the headers. The second occurrence holds the
+    class text, which is stored under "Klasse_text" in the row dicts.
+
+    Args:
+        headers (list): Column headers of the sheet
+
+    Returns:
+        list: Row dict keys, one per column
+
+    """
+    return [
+        "Klasse_text" if header == "Klasse" and col_idx == 3 else header
+        for col_idx, header in enumerate(headers)
+    ]
+
+
 def generate_geojson(data: dict, filename: str) -> None:
     """Generate GeoJSON file with test data.
 
@@ -961,14 +958,8 @@ def generate_geojson(data: dict, filename: str) -> None:
         filename (str): Output GeoJSON filename
 
     """
-    # Determine CRS based on the region zone used
-    utm_zone = data.get("utm_zone", 32)  # Default to zone 32
-    if utm_zone == 32:
-        epsg_code = "EPSG:25832"
-    elif utm_zone == 33:
-        epsg_code = "EPSG:25833"
-    else:
-        epsg_code = "EPSG:25832"  # Default to zone 32
+    # Determine CRS based on the region zone used, defaulting to zone 32
+    epsg_code = EPSG_CODE_BY_UTM_ZONE.get(data.get("utm_zone", 32), "EPSG:25832")
 
     # Create GeoJSON structure
     geojson = {
@@ -982,8 +973,8 @@ def generate_geojson(data: dict, filename: str) -> None:
 
     # Add line features (Trase Elements)
     for line in data["trase_lines"]:
-        # Make sure coordinates are 2D only (no height)
-        coordinates = [line["coordinates"][0], line["coordinates"][1]]
+        # Trase lines always hold exactly two 2D points (no height)
+        coordinates = line["coordinates"]
 
         feature = {
             "type": "Feature",
@@ -1024,25 +1015,21 @@ def generate_geojson(data: dict, filename: str) -> None:
         json.dump(geojson, f, ensure_ascii=False, indent=2)
 
 
+@lru_cache(maxsize=32)
 def from_nrl_luftspenn_type(luftspenn_type: str) -> int:
     """Map NRL luftspennType string to integer code."""
-    if re.search(r"regional", luftspenn_type, re.IGNORECASE):
-        return 8
-    if re.search(r"h[oø]gspent|h[oø]yspent", luftspenn_type, re.IGNORECASE):
-        return 4
-    if re.search(r"lavspent", luftspenn_type, re.IGNORECASE):
-        return 6
+    for pattern, code in _NRL_TYPE_CODES:
+        if pattern.search(luftspenn_type):
+            return code
     msg = f"Unexpected luftspenn_type: {luftspenn_type}"
     raise ValueError(msg)
 
 
+@lru_cache(maxsize=32)
 def from_nrl_mast_type(mast_type: str) -> int:
     """Map NRL mastType string to integer code."""
-    if re.search(r"regional", mast_type, re.IGNORECASE):
-        return 8
-    if re.search(r"h[oø]gspent|h[oø]yspent", mast_type, re.IGNORECASE):
-        return 4
-    if re.search(r"lavspent", mast_type, re.IGNORECASE):
-        return 6
+    for pattern, code in _NRL_TYPE_CODES:
+        if pattern.search(mast_type):
+            return code
     msg = f"Unexpected mast_type: {mast_type}"
     raise ValueError(msg)
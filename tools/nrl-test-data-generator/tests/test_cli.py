@@ -3,6 +3,7 @@
 import importlib.metadata
 from pathlib import Path
 
+import pytest
 from click.testing import CliRunner
 from nrl_sdk_lib.models import FeatureCollection
 
@@ -21,64 +22,66 @@ def test_cli_with_version() -> None:
     assert (f"nrl-test-data-generator, {expected_version_no_cli}\n") == result.output
 
 
-def test_cli_with_no_options() -> None:
-    """Should result in exit code 0 and two files with 4 elements."""
-    runner = CliRunner()
-    with runner.isolated_filesystem():
-        result = runner.invoke(cli)
-        assert result.exit_code == 0, result.output
-
-        # Check that two files are created
-        files = list(Path().glob("testdata_4_elements_*.*"))
-        assert len(files) == 2, f"Expected 2 files, found {len(files)}"
-
-
-def test_cli_with_total_elements_8() -> None:
-    """Should result in exit code 0 and two files with 8 elements."""
-    runner = CliRunner()
-    with runner.isolated_filesystem():
-        result = runner.invoke(cli, ["--total-elements", "8"])
-        assert result.exit_code == 0, result.output
-
-        # Check that two files are created
-        files = list(Path().glob("testdata_8_elements_*.*"))
-        assert len(files) == 2, f"Expected 2 files, found {len(files)}"
-
-
-def test_cli_with_region() -> None:
-    """Should result in exit code 0 and two files with 4 elements."""
-    runner = CliRunner()
-    with runner.isolated_filesystem():
-        result = runner.invoke(cli, ["--region", "Oslo_area"])
-        assert result.exit_code == 0, result.output
-
-        # Check that two files are created
-        files = list(Path().glob("testdata_4_elements_*.*"))
-        assert len(files) == 2, f"Expected 2 files, found {len(files)}"
-
-
-def test_cli_with_include_errors() -> None:
-    """Should result in exit code 0 and two files with 4 elements."""
+@pytest.mark.parametrize(
+    ("args", "file_pattern", "expected_files"),
+    [
+        ([], "testdata_4_elements_*.*", 2),
+        (["--total-elements", "8"], "testdata_8_elements_*.*", 2),
+        (["--region", "Oslo_area"], "testdata_4_elements_*.*", 2),
+        (["--include-errors"], "testdata_4_elements_*.*", 2),
+        (["--exclude-errors"], "testdata_4_elements_*.*", 2),
+        (["--error-pos", "1,3"], "testdata_4_elements_*.*", 3),
+    ],
+    ids=[
+        "no_options",
+        "total_elements_8",
+        "region",
+        "include_errors",
+        "exclude_errors",
+        "error_pos",
+    ],
+)
+def test_cli_with_options(
+    args: list[str], file_pattern: str, expected_files: int
+) -> None:
+    """Should result in exit code 0 and the expected number of files."""
     runner = CliRunner()
     with runner.isolated_filesystem():
-        result = runner.invoke(cli, ["--include-errors"])
+        result = runner.invoke(cli, args)
         assert result.exit_code == 0, result.output
 
-        # Check that two files are created
-        files = list(Path().glob("testdata_4_elements_*.*"))
-        assert len(files) == 2, f"Expected 2 files, found {len(files)}"
+        # Check that the expected files are created
+        files = list(Path().glob(file_pattern))
+        assert len(files) == expected_files, (
+            f"Expected {expected_files} files, found {len(files)}"
+        )
 
 
-def test_cli_with_exclude_errors() -> None:
-    """Should result in exit code 0 and two files with 4 elements."""
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["--error-freq", "1.2"],
+        ["--error-pos", "1.3"],
+        ["--error-pos", "1,,3"],
+        ["--error-pos", ","],
+    ],
+    ids=[
+        "error_freq_gt_1",
+        "faulty_error_pos",
+        "empty_error_pos_entry",
+        "only_empty_error_pos",
+    ],
+)
+def test_cli_with_invalid_options(args: list[str]) -> None:
+    """Should result in exit code 1 and no files."""
     runner = CliRunner()
     with runner.isolated_filesystem():
-        result = runner.invoke(cli, ["--exclude-errors"])
-        assert result.exit_code == 0, result.output
+        result = runner.invoke(cli, args)
+        assert result.exit_code == 1, result.output
 
-        # Check that two files are created
+        # Check that no files are created
         files = list(Path().glob("testdata_4_elements_*.*"))
-        assert len(files) == 2, f"Expected 2 files, found {len(files)}"
+        assert len(files) == 0, f"Expected 0 files, found {len(files)}"
 
 
 def test_cli_with_error_freq() -> None:
@@ -93,42 +96,6 @@ def test_cli_with_error_freq() -> None:
         assert len(files) == 2 or 3, f"Expected 2 or 3 files, found {len(files)}"
 
 
-def test_cli_with_error_freq_gt_1() -> None:
-    """Should result in exit code 1 and no files."""
-    runner = CliRunner()
-    with runner.isolated_filesystem():
-        result = runner.invoke(cli, ["--error-freq", "1.2"])
-        assert result.exit_code == 1, result.output
-
-        # Check that two files are created
-        files = list(Path().glob("testdata_4_elements_*.*"))
-        assert len(files) == 0, f"Expected 0 files, found {len(files)}"
-
-
-def test_cli_with_error_pos() -> None:
-    """Should result in exit code 0 and two files with 4 elements."""
-    runner = CliRunner()
-    with runner.isolated_filesystem():
-        result = runner.invoke(cli, ["--error-pos", "1,3"])
-        assert result.exit_code == 0, result.output
-
-        # Check that two files are created
-        files = list(Path().glob("testdata_4_elements_*.*"))
-        assert len(files) == 3, f"Expected 3 files, found {len(files)}"
-
-
-def test_cli_with_faulty_error_pos() -> None:
-    """Should result in exit code 1 and no files."""
-    runner = CliRunner()
-    with runner.isolated_filesystem():
-        result = runner.invoke(cli, ["--error-pos", "1.3"])
-        assert result.exit_code == 1, result.output
-
-        # Check that two files are created
-        files = list(Path().glob("testdata_4_elements_*.*"))
-        assert len(files) == 0, f"Expected 0 files, found {len(files)}"
-
-
 def test_cli_with_version_2() -> None:
     """Should result in exit code 0 and one valid file with 4 elements."""
     runner = CliRunner()